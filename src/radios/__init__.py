@@ -1,24 +1,86 @@
 """Asynchronous Python client for the Radio Browser APIs."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .const import FilterBy, Order
 from .exceptions import (
     RadioBrowserConnectionError,
     RadioBrowserConnectionTimeoutError,
     RadioBrowserError,
 )
-from .models import Country, Language, Station, Stats, Tag
-from .radio_browser import RadioBrowser
+
+if TYPE_CHECKING:
+    from .cache import CacheBackend, MemoryCache, SQLiteCache
+    from .geo import NearbyStation, StationIndex
+    from .models import Country, Language, Station, Stats, Tag
+    from .radio_browser import RadioBrowser
+    from .ranking import StationRanking
+
+# The client and models pull in heavy dependencies (aiohttp, mashumaro, ...),
+# so they are only imported once they are accessed.
+_LAZY_IMPORTS = {
+    "CacheBackend": ".cache",
+    "Country": ".models",
+    "Language": ".models",
+    "MemoryCache": ".cache",
+    "NearbyStation": ".geo",
+    "RadioBrowser": ".radio_browser",
+    "SQLiteCache": ".cache",
+    "Station": ".models",
+    "StationIndex": ".geo",
+    "StationRanking": ".ranking",
+    "Stats": ".models",
+    "Tag": ".models",
+}
 
 __all__ = [
+    "CacheBackend",
     "Country",
     "FilterBy",
     "Language",
+    "MemoryCache",
+    "NearbyStation",
     "Order",
     "RadioBrowser",
     "RadioBrowserConnectionError",
     "RadioBrowserConnectionTimeoutError",
     "RadioBrowserError",
+    "SQLiteCache",
     "Station",
+    "StationIndex",
+    "StationRanking",
     "Stats",
     "Tag",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public classes on first access.
+
+    Args:
+    ----
+        name: Name of the attribute.
+
+    Returns:
+    -------
+        The requested class.
+
+    Raises:
+    ------
+        AttributeError: The attribute does not exist.
+
+    """
+    if (module := _LAZY_IMPORTS.get(name)) is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the public names of this module, including lazy ones."""
+    return sorted([*__all__, *(name for name in globals() if name.startswith("__"))])
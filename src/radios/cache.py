@@ -0,0 +1,309 @@
+"""Cache backends for Radio Browser API responses."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import secrets
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager, closing, suppress
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from contextlib import AbstractAsyncContextManager
+    from pathlib import Path
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CacheBackend(ABC):
+    """Interface for caching responses of the Radio Browser API."""
+
+    @abstractmethod
+    async def get(self, key: str) -> str | None:
+        """Get a cached response.
+
+        Args:
+        ----
+            key: Cache key of the request.
+
+        Returns:
+        -------
+            The cached response, or None if missing or expired.
+
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        """Store a response in the cache.
+
+        Args:
+        ----
+            key: Cache key of the request.
+            value: The response to store.
+            ttl: Number of seconds the response stays valid.
+
+        """
+
+    @abstractmethod
+    def lock(self, key: str) -> AbstractAsyncContextManager[None]:
+        """Hold an exclusive lock for refreshing a cache key.
+
+        Used as an async context manager, so that only one caller fetches
+        a missing response, while others wait and use the cached result.
+
+        Args:
+        ----
+            key: Cache key of the request.
+
+        Returns:
+        -------
+            An async context manager holding the lock.
+
+        """
+
+
+class MemoryCache(CacheBackend):
+    """Cache backend holding responses in memory of the current process."""
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._data: dict[str, tuple[float, str]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        # Number of callers holding or waiting for each lock.
+        self._lock_users: dict[str, int] = {}
+
+    async def get(self, key: str) -> str | None:
+        """Get a cached response.
+
+        Args:
+        ----
+            key: Cache key of the request.
+
+        Returns:
+        -------
+            The cached response, or None if missing or expired.
+
+        """
+        if (item := self._data.get(key)) is None:
+            return None
+        expires, value = item
+        if expires < time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        """Store a response in the cache.
+
+        Args:
+        ----
+            key: Cache key of the request.
+            value: The response to store.
+            ttl: Number of seconds the response stays valid.
+
+        """
+        self._data[key] = (time.monotonic() + ttl, value)
+
+    def lock(self, key: str) -> AbstractAsyncContextManager[None]:
+        """Hold an exclusive lock for refreshing a cache key.
+
+        Args:
+        ----
+            key: Cache key of the request.
+
+        Returns:
+        -------
+            An async context manager holding the lock.
+
+        """
+        return self._hold(key)
+
+    @asynccontextmanager
+    async def _hold(self, key: str) -> AsyncIterator[None]:
+        """Hold the lock for a cache key, removing it once unused."""
+        if (lock := self._locks.get(key)) is None:
+            lock = self._locks[key] = asyncio.Lock()
+        self._lock_users[key] = self._lock_users.get(key, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._lock_users[key] -= 1
+            if not self._lock_users[key]:
+                del self._lock_users[key]
+                del self._locks[key]
+
+
+class SQLiteCache(CacheBackend):
+    """Cache backend storing responses in a SQLite database.
+
+    The database file can be shared by multiple processes on the same
+    host, so they share fetched responses. Locks are stored in the
+    database as well. A held lock is refreshed while its owner is alive,
+    and is considered stale `lock_timeout` seconds after its last refresh,
+    so a crashed process cannot block others forever.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        lock_timeout: float = 30.0,
+        poll_interval: float = 0.1,
+    ) -> None:
+        """Initialize the cache, creating the database if needed.
+
+        Args:
+        ----
+            path: Path to the SQLite database file.
+            lock_timeout: Seconds after which a lock that is no longer
+                refreshed is considered stale.
+            poll_interval: Seconds between attempts to acquire a held lock.
+
+        """
+        self.path = path
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+        with closing(self._connect()) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS locks "
+                "(key TEXT PRIMARY KEY, token TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+            connection.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the database."""
+        return sqlite3.connect(self.path)
+
+    def _get(self, key: str) -> str | None:
+        """Get a cached response from the database."""
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT value FROM responses WHERE key = ? AND expires >= ?",
+                (key, time.time()),
+            ).fetchone()
+        return None if row is None else str(row[0])
+
+    def _set(self, key: str, value: str, ttl: float) -> None:
+        """Store a response in the database."""
+        with closing(self._connect()) as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires) "
+                "VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl),
+            )
+            connection.execute(
+                "DELETE FROM responses WHERE expires < ?", (time.time(),)
+            )
+            connection.commit()
+
+    def _acquire(self, key: str, token: str) -> bool:
+        """Try to acquire the lock for a cache key."""
+        now = time.time()
+        with closing(self._connect()) as connection:
+            connection.execute(
+                "DELETE FROM locks WHERE key = ? AND expires < ?", (key, now)
+            )
+            cursor = connection.execute(
+                "INSERT OR IGNORE INTO locks (key, token, expires) VALUES (?, ?, ?)",
+                (key, token, now + self.lock_timeout),
+            )
+            connection.commit()
+            return cursor.rowcount == 1
+
+    def _refresh(self, key: str, token: str) -> None:
+        """Extend the lock for a cache key, if still owned."""
+        with closing(self._connect()) as connection:
+            connection.execute(
+                "UPDATE locks SET expires = ? WHERE key = ? AND token = ?",
+                (time.time() + self.lock_timeout, key, token),
+            )
+            connection.commit()
+
+    def _release(self, key: str, token: str) -> None:
+        """Release the lock for a cache key, if still owned."""
+        with closing(self._connect()) as connection:
+            connection.execute(
+                "DELETE FROM locks WHERE key = ? AND token = ?", (key, token)
+            )
+            connection.commit()
+
+    async def get(self, key: str) -> str | None:
+        """Get a cached response.
+
+        Args:
+        ----
+            key: Cache key of the request.
+
+        Returns:
+        -------
+            The cached response, or None if missing or expired.
+
+        """
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        """Store a response in the cache.
+
+        Args:
+        ----
+            key: Cache key of the request.
+            value: The response to store.
+            ttl: Number of seconds the response stays valid.
+
+        """
+        await asyncio.to_thread(self._set, key, value, ttl)
+
+    def lock(self, key: str) -> AbstractAsyncContextManager[None]:
+        """Hold an exclusive lock for refreshing a cache key.
+
+        Args:
+        ----
+            key: Cache key of the request.
+
+        Returns:
+        -------
+            An async context manager holding the lock.
+
+        """
+        return self._hold(key)
+
+    async def _keep_alive(self, key: str, token: str) -> None:
+        """Refresh a held lock until cancelled."""
+        while True:
+            await asyncio.sleep(self.lock_timeout / 3)
+            try:
+                await asyncio.to_thread(self._refresh, key, token)
+            except sqlite3.Error as err:
+                # Keep holding the lock, another refresh may still succeed
+                # before it becomes stale.
+                _LOGGER.warning("Failed to refresh the lock of %s: %s", key, err)
+
+    @asynccontextmanager
+    async def _hold(self, key: str) -> AsyncIterator[None]:
+        """Hold the lock for a cache key, refreshing it while held."""
+        token = secrets.token_hex(16)
+        acquired = await asyncio.to_thread(self._acquire, key, token)
+        while not acquired:
+            await asyncio.sleep(self.poll_interval)
+            acquired = await asyncio.to_thread(self._acquire, key, token)
+
+        keep_alive = asyncio.create_task(self._keep_alive(key, token))
+        try:
+            yield
+        finally:
+            keep_alive.cancel()
+            try:
+                with suppress(asyncio.CancelledError):
+                    await keep_alive
+            finally:
+                await asyncio.to_thread(self._release, key, token)
@@ -0,0 +1,343 @@
+"""Geo-spatial index over Radio Browser stations."""
+
+from __future__ import annotations
+
+import heapq
+import math
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .models import Station
+
+EARTH_RADIUS = 6371.0088
+
+
+@dataclass
+class NearbyStation:
+    """Object holding a station and its distance to a queried point."""
+
+    station: Station
+    distance: float
+
+
+def _to_vector(latitude: float, longitude: float) -> tuple[float, float, float]:
+    """Convert a coordinate to a point on the unit sphere.
+
+    Args:
+    ----
+        latitude: Latitude in degrees.
+        longitude: Longitude in degrees.
+
+    Returns:
+    -------
+        A 3D unit vector.
+
+    """
+    lat = math.radians(latitude)
+    lon = math.radians(longitude)
+    return (
+        math.cos(lat) * math.cos(lon),
+        math.cos(lat) * math.sin(lon),
+        math.sin(lat),
+    )
+
+
+def _chord_to_distance(chord: float) -> float:
+    """Convert a chord length on the unit sphere to a distance in kilometers."""
+    return 2 * EARTH_RADIUS * math.asin(min(1.0, chord / 2))
+
+
+def _distance_to_chord(distance: float) -> float:
+    """Convert a distance in kilometers to a chord length on the unit sphere."""
+    return 2 * math.sin(min(math.pi, distance / EARTH_RADIUS) / 2)
+
+
+class StationIndex:
+    """Spatial index for nearest and within-area station lookups.
+
+    Stations are stored in a k-d tree over their position on the unit
+    sphere, so nearest neighbour and radius queries are correct across
+    the poles and the antimeridian. Stations without coordinates are
+    left out of the index.
+
+    Queries filtered by codec use a separate index per codec, built on
+    first use. Bitrate filters are checked while searching the tree, so
+    a bitrate range that only few stations match makes `nearest` visit
+    most of the tree.
+    """
+
+    def __init__(self, stations: Iterable[Station]) -> None:
+        """Build the index from a list of stations.
+
+        Args:
+        ----
+            stations: The stations to index.
+
+        """
+        self._stations: list[Station] = []
+        self._points: list[tuple[float, float, float]] = []
+        # Latitude, longitude and station index, sorted by latitude.
+        self._by_latitude: list[tuple[float, float, int]] = []
+        for station in stations:
+            if station.latitude is None or station.longitude is None:
+                continue
+            self._by_latitude.append(
+                (station.latitude, station.longitude, len(self._stations))
+            )
+            self._stations.append(station)
+            self._points.append(_to_vector(station.latitude, station.longitude))
+        self._by_latitude.sort()
+
+        # Node `i` of the tree is `(point index, split axis, left, right)`,
+        # where the children are node numbers, or -1 if absent.
+        self._nodes: list[tuple[int, int, int, int]] = []
+        self._root = self._build(list(range(len(self._points))), 0)
+
+        self._codec_indexes: dict[str, StationIndex] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed stations."""
+        return len(self._stations)
+
+    def _build(self, indices: list[int], depth: int) -> int:
+        """Recursively build the k-d tree.
+
+        Args:
+        ----
+            indices: Point indices to put in this subtree.
+            depth: Depth of the subtree root.
+
+        Returns:
+        -------
+            The node number of the subtree root, or -1 if empty.
+
+        """
+        if not indices:
+            return -1
+        axis = depth % 3
+        indices.sort(key=lambda i: self._points[i][axis])
+        median = len(indices) // 2
+        left = self._build(indices[:median], depth + 1)
+        right = self._build(indices[median + 1 :], depth + 1)
+        self._nodes.append((indices[median], axis, left, right))
+        return len(self._nodes) - 1
+
+    def _for_codec(self, codec: str) -> StationIndex:
+        """Get the index holding only the stations using a codec.
+
+        Args:
+        ----
+            codec: Name of the codec.
+
+        Returns:
+        -------
+            A StationIndex object.
+
+        """
+        codec = codec.lower()
+        if (index := self._codec_indexes.get(codec)) is None:
+            index = self._codec_indexes[codec] = StationIndex(
+                station for station in self._stations if station.codec.lower() == codec
+            )
+        return index
+
+    @staticmethod
+    def _matches(station: Station, bitrate_min: int, bitrate_max: int | None) -> bool:
+        """Check if a station passes the optional bitrate filters."""
+        if station.bitrate < bitrate_min:
+            return False
+        return bitrate_max is None or station.bitrate <= bitrate_max
+
+    # pylint: disable-next=too-many-arguments, too-many-locals
+    def nearest(  # noqa: PLR0913
+        self,
+        latitude: float,
+        longitude: float,
+        *,
+        limit: int = 10,
+        codec: str | None = None,
+        bitrate_min: int = 0,
+        bitrate_max: int | None = None,
+    ) -> list[NearbyStation]:
+        """Get the stations nearest to a point.
+
+        Args:
+        ----
+            latitude: Latitude of the point.
+            longitude: Longitude of the point.
+            limit: Maximum number of stations to return.
+            codec: Only return stations using this codec.
+            bitrate_min: Only return stations with at least this bitrate.
+            bitrate_max: Only return stations with at most this bitrate.
+
+        Returns:
+        -------
+            A list of NearbyStation objects, nearest first.
+
+        """
+        if codec is not None:
+            return self._for_codec(codec).nearest(
+                latitude,
+                longitude,
+                limit=limit,
+                bitrate_min=bitrate_min,
+                bitrate_max=bitrate_max,
+            )
+        if limit <= 0:
+            return []
+        target = _to_vector(latitude, longitude)
+        # Max-heap (by negated distance) holding the best candidates so far.
+        best: list[tuple[float, int]] = []
+        # Subtrees are stacked with the distance to their splitting plane,
+        # so they can be pruned once enough closer stations are found.
+        stack = [(self._root, 0.0)]
+        while stack:
+            node, bound = stack.pop()
+            if node == -1 or (len(best) == limit and bound >= -best[0][0]):
+                continue
+            index, axis, left, right = self._nodes[node]
+            point = self._points[index]
+            chord = math.dist(target, point)
+            if (len(best) < limit or chord < -best[0][0]) and self._matches(
+                self._stations[index], bitrate_min, bitrate_max
+            ):
+                if len(best) < limit:
+                    heapq.heappush(best, (-chord, index))
+                else:
+                    heapq.heapreplace(best, (-chord, index))
+
+            delta = target[axis] - point[axis]
+            near, far = (left, right) if delta < 0 else (right, left)
+            stack.append((far, abs(delta)))
+            stack.append((near, 0.0))
+
+        return [
+            NearbyStation(
+                station=self._stations[index],
+                distance=_chord_to_distance(-negated),
+            )
+            for negated, index in sorted(best, reverse=True)
+        ]
+
+    # pylint: disable-next=too-many-arguments, too-many-locals
+    def within_radius(  # noqa: PLR0913
+        self,
+        latitude: float,
+        longitude: float,
+        radius: float,
+        *,
+        codec: str | None = None,
+        bitrate_min: int = 0,
+        bitrate_max: int | None = None,
+    ) -> list[NearbyStation]:
+        """Get all stations within a radius of a point.
+
+        Args:
+        ----
+            latitude: Latitude of the point.
+            longitude: Longitude of the point.
+            radius: Radius in kilometers.
+            codec: Only return stations using this codec.
+            bitrate_min: Only return stations with at least this bitrate.
+            bitrate_max: Only return stations with at most this bitrate.
+
+        Returns:
+        -------
+            A list of NearbyStation objects, nearest first.
+
+        """
+        if codec is not None:
+            return self._for_codec(codec).within_radius(
+                latitude,
+                longitude,
+                radius,
+                bitrate_min=bitrate_min,
+                bitrate_max=bitrate_max,
+            )
+        target = _to_vector(latitude, longitude)
+        max_chord = _distance_to_chord(radius)
+        found: list[tuple[float, int]] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node == -1:
+                continue
+            index, axis, left, right = self._nodes[node]
+            point = self._points[index]
+            chord = math.dist(target, point)
+            if chord <= max_chord and self._matches(
+                self._stations[index], bitrate_min, bitrate_max
+            ):
+                found.append((chord, index))
+
+            delta = target[axis] - point[axis]
+            if delta <= max_chord:
+                stack.append(left)
+            if -delta <= max_chord:
+                stack.append(right)
+
+        found.sort()
+        return [
+            NearbyStation(
+                station=self._stations[index],
+                distance=_chord_to_distance(chord),
+            )
+            for chord, index in found
+        ]
+
+    # pylint: disable-next=too-many-arguments
+    def within_bbox(  # noqa: PLR0913
+        self,
+        south: float,
+        west: float,
+        north: float,
+        east: float,
+        *,
+        codec: str | None = None,
+        bitrate_min: int = 0,
+        bitrate_max: int | None = None,
+    ) -> list[Station]:
+        """Get all stations within a bounding box.
+
+        A box with `west` greater than `east` crosses the antimeridian.
+
+        Args:
+        ----
+            south: Southern latitude of the box.
+            west: Western longitude of the box.
+            north: Northern latitude of the box.
+            east: Eastern longitude of the box.
+            codec: Only return stations using this codec.
+            bitrate_min: Only return stations with at least this bitrate.
+            bitrate_max: Only return stations with at most this bitrate.
+
+        Returns:
+        -------
+            A list of Station objects, ordered by latitude.
+
+        """
+        if codec is not None:
+            return self._for_codec(codec).within_bbox(
+                south,
+                west,
+                north,
+                east,
+                bitrate_min=bitrate_min,
+                bitrate_max=bitrate_max,
+            )
+        start = bisect_left(self._by_latitude, south, key=lambda item: item[0])
+        end = bisect_right(self._by_latitude, north, key=lambda item: item[0])
+        stations = []
+        for _, longitude, index in self._by_latitude[start:end]:
+            if west <= east:
+                inside = west <= longitude <= east
+            else:
+                inside = longitude >= west or longitude <= east
+            station = self._stations[index]
+            if inside and self._matches(station, bitrate_min, bitrate_max):
+                stations.append(station)
+        return stations
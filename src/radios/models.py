@@ -1,13 +1,12 @@
 """Models for the Radio Browser API."""
 
-# pylint: disable=too-few-public-methods
+# pylint: disable=too-few-public-methods, import-outside-toplevel
 from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import cast
 
-import pycountry
 from awesomeversion import AwesomeVersion
 from mashumaro import field_options
 from mashumaro.mixins.orjson import DataClassORJSONMixin
@@ -105,6 +104,8 @@ class Station(DataClassORJSONMixin):
             Country name or None if no country code is set.
 
         """
+        import pycountry  # noqa: PLC0415
+
         if resolved_country := pycountry.countries.get(alpha_2=self.country_code):
             return cast("str", resolved_country.name)
         return None
@@ -1,31 +1,45 @@
 """Asynchronous Python client for the Radio Browser API."""
 
+# Heavy dependencies not needed to define the client are imported on first use.
+# pylint: disable=import-outside-toplevel
+# ruff: noqa: PLC0415
 from __future__ import annotations
 
 import asyncio
 import random
 import socket
-from dataclasses import dataclass
-from typing import Any, Self
+import statistics
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from functools import cache
+from typing import TYPE_CHECKING, Any, Self
 
 import aiohttp
-import backoff
 import orjson
-import pycountry
 from aiodns import DNSResolver
-from aiohttp import hdrs
 from yarl import URL
 
+# Imported at runtime, so typing.get_type_hints() can resolve the fields
+from .cache import CacheBackend  # noqa: TC001
 from .const import FilterBy, Order
 from .exceptions import (
     RadioBrowserConnectionError,
     RadioBrowserConnectionTimeoutError,
     RadioBrowserError,
 )
-from .models import Country, Language, Station, Stats, Tag
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from .models import Country, Language, Station, Stats, Tag
+
+HEDGE_DEFAULT_DELAY = 1.0
+HEDGE_MIN_SAMPLES = 20
 
 
 @dataclass
+# pylint: disable-next=too-many-instance-attributes
 class RadioBrowser:
     """Main class for handling connections with the Radio Browser API."""
 
@@ -33,29 +47,106 @@ class RadioBrowser:
 
     request_timeout: float = 8.0
     session: aiohttp.client.ClientSession | None = None
+    cache: CacheBackend | None = None
+    cache_ttl: float = 300.0
+    hedge: bool = False
+    hedge_delay: float | None = None
 
     _close_session: bool = False
     _host: str | None = None
+    _hosts: list[str] = field(default_factory=list)
+    _latencies: dict[str, deque[float]] = field(default_factory=dict)
 
-    @backoff.on_exception(
-        backoff.expo, RadioBrowserConnectionError, max_tries=5, logger=None
-    )
     async def _request(
         self,
         uri: str = "",
-        method: str = hdrs.METH_GET,
+        method: str = "GET",
         params: dict[str, Any] | None = None,
+        *,
+        idempotent: bool = True,
     ) -> str:
         """Handle a request to the Radio Browser API.
 
         A generic method for sending/handling HTTP requests done against
-        the Radio Browser API.
+        the Radio Browser API. If a cache backend is configured, GET
+        responses are served from and stored in the cache, and only a
+        single caller fetches a missing response.
+
+        Args:
+        ----
+            uri: Request URI, for example `stats`.
+            method: HTTP method to use for the request.E.g., "GET" or "POST".
+            params: Dictionary of data to send to the Radio Browser API.
+            idempotent: Whether the request may be cached and sent more than
+                once, which is not the case for requests with side effects.
+
+        Returns:
+        -------
+            The response from the Radio Browser API.
+
+        """
+        if params:
+            for key, value in params.items():
+                if isinstance(value, bool):
+                    params[key] = str(value).lower()
+
+        if self.cache is None or not idempotent or method != "GET":
+            return await self._fetch(uri, method, params, idempotent=idempotent)
+
+        # pylint: disable-next=no-member
+        query = orjson.dumps(params, option=orjson.OPT_SORT_KEYS).decode()
+        cache_key = f"{method} {uri} {query}"
+        if (text := await self.cache.get(cache_key)) is not None:
+            return text
+        async with self.cache.lock(cache_key):
+            if (text := await self.cache.get(cache_key)) is not None:
+                return text
+            text = await self._fetch(uri, method, params, idempotent=idempotent)
+            await self.cache.set(cache_key, text, self.cache_ttl)
+        return text
+
+    async def _fetch(
+        self,
+        uri: str,
+        method: str,
+        params: dict[str, Any] | None,
+        *,
+        idempotent: bool,
+    ) -> str:
+        """Fetch a response from the Radio Browser API, retrying on errors.
+
+        Args:
+        ----
+            uri: Request URI, for example `stats`.
+            method: HTTP method to use for the request.E.g., "GET" or "POST".
+            params: Dictionary of data to send to the Radio Browser API.
+            idempotent: Whether the request may be sent to multiple mirrors.
+
+        Returns:
+        -------
+            The response from the Radio Browser API.
+
+        """
+        return await _fetch_with_retries()(
+            self, uri, method, params, idempotent=idempotent
+        )
+
+    async def _fetch_once(
+        self,
+        uri: str,
+        method: str,
+        params: dict[str, Any] | None,
+        *,
+        idempotent: bool,
+    ) -> str:
+        """Fetch a response from the Radio Browser API.
 
         Args:
         ----
             uri: Request URI, for example `stats`.
             method: HTTP method to use for the request.E.g., "GET" or "POST".
             params: Dictionary of data to send to the Radio Browser API.
+            idempotent: Whether the request may be sent to multiple mirrors.
 
         Returns:
         -------
@@ -75,35 +166,20 @@ class RadioBrowser:
             resolver = DNSResolver()
             result = await resolver.query("_api._tcp.radio-browser.info", "SRV")
             random.shuffle(result)
-            self._host = result[0].host
-
-        url = URL.build(scheme="https", host=self._host, path="/json/").join(URL(uri))
+            self._hosts = [record.host for record in result]
+            self._host = self._hosts[0]
 
-        if self.session is None:
-            self.session = aiohttp.ClientSession()
-            self._close_session = True
-
-        if params:
-            for key, value in params.items():
-                if isinstance(value, bool):
-                    params[key] = str(value).lower()
         try:
             async with asyncio.timeout(self.request_timeout):
-                response = await self.session.request(
-                    method,
-                    url,
-                    headers={
-                        "User-Agent": self.user_agent,
-                        "Accept": "application/json",
-                    },
-                    params=params,
-                    raise_for_status=True,
-                )
-
-            content_type = response.headers.get("Content-Type", "")
-            text = await response.text()
-            if "application/json" not in content_type:
-                raise RadioBrowserError(response.status, {"message": text})
+                if (
+                    self.hedge
+                    and idempotent
+                    and method == "GET"
+                    and len(self._hosts) > 1
+                ):
+                    text = await self._hedged_send(self._host, uri, method, params)
+                else:
+                    text = await self._send(self._host, uri, method, params)
         except asyncio.TimeoutError as exception:
             self._host = None
             msg = "Timeout occurred while connecting to the Radio Browser API"
@@ -115,6 +191,168 @@ class RadioBrowser:
 
         return text
 
+    async def _send(
+        self,
+        host: str,
+        uri: str,
+        method: str,
+        params: dict[str, Any] | None,
+    ) -> str:
+        """Send a single request to a Radio Browser API mirror.
+
+        Args:
+        ----
+            host: Hostname of the mirror.
+            uri: Request URI, for example `stats`.
+            method: HTTP method to use for the request.E.g., "GET" or "POST".
+            params: Dictionary of data to send to the Radio Browser API.
+
+        Returns:
+        -------
+            The response from the Radio Browser API.
+
+        Raises:
+        ------
+            RadioBrowserError: Received an unexpected response from the
+                Radio Browser API.
+
+        """
+        url = URL.build(scheme="https", host=host, path="/json/").join(URL(uri))
+
+        if self.session is None:
+            self.session = aiohttp.ClientSession()
+            self._close_session = True
+
+        start = time.monotonic()
+        response = await self.session.request(
+            method,
+            url,
+            headers={
+                "User-Agent": self.user_agent,
+                "Accept": "application/json",
+            },
+            params=params,
+            raise_for_status=True,
+        )
+
+        content_type = response.headers.get("Content-Type", "")
+        text = await response.text()
+        if "application/json" not in content_type:
+            raise RadioBrowserError(response.status, {"message": text})
+        self._record_latency(uri, time.monotonic() - start)
+        return text
+
+    @staticmethod
+    def _endpoint(uri: str) -> str:
+        """Return the endpoint of a request URI, without its filter term.
+
+        Args:
+        ----
+            uri: Request URI, for example `stations/byname/538`.
+
+        Returns:
+        -------
+            The endpoint, for example `stations/byname`.
+
+        """
+        return "/".join(uri.split("/")[:2])
+
+    def _record_latency(self, uri: str, latency: float) -> None:
+        """Record the latency of a request to its endpoint.
+
+        Args:
+        ----
+            uri: Request URI, for example `stats`.
+            latency: Seconds the request took.
+
+        """
+        endpoint = self._endpoint(uri)
+        if (latencies := self._latencies.get(endpoint)) is None:
+            latencies = self._latencies[endpoint] = deque(maxlen=100)
+        latencies.append(latency)
+
+    def _hedge_budget(self, uri: str) -> float:
+        """Return how long to wait on a mirror before hedging a request.
+
+        Args:
+        ----
+            uri: Request URI, for example `stats`.
+
+        Returns:
+        -------
+            The configured hedge delay, or the observed 95th percentile
+            latency of the endpoint once enough requests have been made.
+
+        """
+        if self.hedge_delay is not None:
+            return self.hedge_delay
+        latencies = self._latencies.get(self._endpoint(uri), ())
+        if len(latencies) < HEDGE_MIN_SAMPLES:
+            return HEDGE_DEFAULT_DELAY
+        return statistics.quantiles(latencies, n=20)[-1]
+
+    async def _hedged_send(
+        self,
+        host: str,
+        uri: str,
+        method: str,
+        params: dict[str, Any] | None,
+    ) -> str:
+        """Send a request, duplicating it to a second mirror if it is slow.
+
+        If the first mirror has not responded within the hedge budget,
+        or failed, the same request is sent to another mirror. The first
+        successful response wins, and the other request is cancelled.
+
+        Args:
+        ----
+            host: Hostname of the preferred mirror.
+            uri: Request URI, for example `stats`.
+            method: HTTP method to use for the request.E.g., "GET" or "POST".
+            params: Dictionary of data to send to the Radio Browser API.
+
+        Returns:
+        -------
+            The response from the Radio Browser API.
+
+        """
+        hedge_host = random.choice(  # noqa: S311
+            [other for other in self._hosts if other != host]
+        )
+        start = time.monotonic()
+        primary = asyncio.create_task(self._send(host, uri, method, params))
+        pending = {primary}
+        try:
+            await asyncio.wait(pending, timeout=self._hedge_budget(uri))
+            if not primary.done() or primary.exception() is not None:
+                pending.add(
+                    asyncio.create_task(self._send(hedge_host, uri, method, params))
+                )
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # Check every finished task, so no exception goes unretrieved
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded:
+                    winner = primary if primary in succeeded else succeeded[0]
+                    if winner is not primary:
+                        # Stick to the faster mirror for upcoming requests
+                        self._host = hedge_host
+                    return winner.result()
+
+            # Both mirrors failed, report the error of the preferred one
+            return primary.result()
+        finally:
+            if primary in pending:
+                # The primary lost, its latency is at least this long. Leaving
+                # it out would make the budget shrink and hedge ever more.
+                self._record_latency(uri, time.monotonic() - start)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
     async def stats(self) -> Stats:
         """Get Radio Browser service stats.
 
@@ -123,6 +361,8 @@ class RadioBrowser:
             A Stats object, with information about the Radio Browser API.
 
         """
+        from .models import Stats
+
         response = await self._request("stats")
         return Stats.from_json(response)
 
@@ -139,7 +379,7 @@ class RadioBrowser:
             uuid: UUID of the station.
 
         """
-        await self._request(f"url/{uuid}")
+        await self._request(f"url/{uuid}", idempotent=False)
 
     # pylint: disable-next=too-many-arguments
     async def countries(
@@ -166,6 +406,10 @@ class RadioBrowser:
             A Stats object, with information about the Radio Browser API.
 
         """
+        import pycountry
+
+        from .models import Country
+
         countries_data = await self._request(
             "countrycodes",
             params={
@@ -218,6 +462,8 @@ class RadioBrowser:
             A list of Language objects.
 
         """
+        from .models import Language
+
         languages_data = await self._request(
             "languages",
             params={
@@ -283,6 +529,8 @@ class RadioBrowser:
             A list of Station objects.
 
         """
+        from .models import Station
+
         uri = "stations/search"
         if filter_by is not None:
             uri = f"{uri}/{filter_by.value}"
@@ -362,6 +610,8 @@ class RadioBrowser:
             A list of Station objects.
 
         """
+        from .models import Station
+
         uri = "stations"
         if filter_by is not None:
             uri = f"{uri}/{filter_by.value}"
@@ -407,6 +657,8 @@ class RadioBrowser:
             A list of Tags objects.
 
         """
+        from .models import Tag
+
         tags_data = await self._request(
             "tags",
             params={
@@ -445,3 +697,21 @@ class RadioBrowser:
 
         """
         await self.close()
+
+
+@cache
+def _fetch_with_retries() -> Callable[..., Awaitable[str]]:
+    """Return `RadioBrowser._fetch_once` wrapped with retries.
+
+    Built once on first use, so `backoff` is only imported when needed.
+
+    Returns
+    -------
+        The wrapped function, taking the RadioBrowser instance first.
+
+    """
+    import backoff
+
+    return backoff.on_exception(
+        backoff.expo, RadioBrowserConnectionError, max_tries=5, logger=None
+    )(RadioBrowser._fetch_once)  # noqa: SLF001  # pylint: disable=protected-access
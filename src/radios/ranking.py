@@ -0,0 +1,213 @@
+"""Local ranking of Radio Browser stations."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import TYPE_CHECKING
+
+from .const import Order
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .models import Station
+
+RANKING_ORDERS = {
+    Order.CLICK_COUNT: "click_count",
+    Order.CLICK_TREND: "click_trend",
+    Order.VOTES: "votes",
+}
+
+# Leaderboard entries sort on negated score first, so the best come first.
+_Entry = tuple[int, str]
+_Boards = dict[str, list[_Entry]]
+
+
+class StationRanking:
+    """Leaderboards of stations per country, tag and language.
+
+    Every leaderboard is kept sorted as stations are added, updated or
+    removed, so looking up the top stations only slices the first entries
+    instead of sorting or querying the Radio Browser API again.
+    """
+
+    def __init__(
+        self,
+        stations: Iterable[Station] = (),
+        *,
+        order: Order = Order.CLICK_COUNT,
+    ) -> None:
+        """Build the leaderboards from a list of stations.
+
+        Args:
+        ----
+            stations: The stations to rank.
+            order: Rank by this field, one of `Order.CLICK_COUNT`,
+                `Order.CLICK_TREND` or `Order.VOTES`.
+
+        Raises:
+        ------
+            ValueError: The order is not supported for ranking.
+
+        """
+        if order not in RANKING_ORDERS:
+            msg = f"Cannot rank stations by {order.value}"
+            raise ValueError(msg)
+        self.order = order
+        self._attribute = RANKING_ORDERS[order]
+
+        self._stations: dict[str, Station] = {}
+        # The entry and leaderboard keys each station was ranked under, so it
+        # can be removed even if the station object was changed in place.
+        self._entries: dict[str, tuple[_Entry, list[tuple[_Boards, str]]]] = {}
+        self._overall: list[_Entry] = []
+        self._countries: _Boards = {}
+        self._tags: _Boards = {}
+        self._languages: _Boards = {}
+
+        # Build all leaderboards unsorted, then sort each of them once.
+        for station in {station.uuid: station for station in stations}.values():
+            entry = self._entry(station)
+            keys = self._keys(station)
+            self._overall.append(entry)
+            for boards, key in keys:
+                boards.setdefault(key, []).append(entry)
+            self._stations[station.uuid] = station
+            self._entries[station.uuid] = (entry, keys)
+        self._overall.sort()
+        for boards in (self._countries, self._tags, self._languages):
+            for leaderboard in boards.values():
+                leaderboard.sort()
+
+    def __len__(self) -> int:
+        """Return the number of ranked stations."""
+        return len(self._stations)
+
+    def _entry(self, station: Station) -> _Entry:
+        """Return the leaderboard entry of a station."""
+        return (-getattr(station, self._attribute), station.uuid)
+
+    def _keys(self, station: Station) -> list[tuple[_Boards, str]]:
+        """Get the country, tag and language leaderboards of a station.
+
+        Args:
+        ----
+            station: The station to get the leaderboards for.
+
+        Returns:
+        -------
+            A list of leaderboard collections and the key within them.
+
+        """
+        keys: list[tuple[_Boards, str]] = []
+        if station.country_code:
+            keys.append((self._countries, station.country_code.upper()))
+        for boards, names in (
+            (self._tags, station.tags),
+            (self._languages, station.language),
+        ):
+            keys.extend(
+                (boards, key) for key in {name.lower() for name in names if name}
+            )
+        return keys
+
+    def update(self, station: Station) -> None:
+        """Add a station to the ranking or update its position.
+
+        Args:
+        ----
+            station: The new or changed station.
+
+        """
+        self.remove(station.uuid)
+        entry = self._entry(station)
+        keys = self._keys(station)
+        insort(self._overall, entry)
+        for boards, key in keys:
+            insort(boards.setdefault(key, []), entry)
+        self._stations[station.uuid] = station
+        self._entries[station.uuid] = (entry, keys)
+
+    def remove(self, uuid: str) -> None:
+        """Remove a station from the ranking.
+
+        Args:
+        ----
+            uuid: UUID of the station.
+
+        """
+        if (entries := self._entries.pop(uuid, None)) is None:
+            return
+        del self._stations[uuid]
+        entry, keys = entries
+        del self._overall[bisect_left(self._overall, entry)]
+        for boards, key in keys:
+            leaderboard = boards[key]
+            del leaderboard[bisect_left(leaderboard, entry)]
+            if not leaderboard:
+                del boards[key]
+
+    def _top(self, leaderboard: list[_Entry] | None, limit: int) -> list[Station]:
+        """Return the first stations of a leaderboard."""
+        if not leaderboard:
+            return []
+        return [self._stations[uuid] for _, uuid in leaderboard[:limit]]
+
+    def top(self, *, limit: int = 50) -> list[Station]:
+        """Get the top ranked stations.
+
+        Args:
+        ----
+            limit: Maximum number of stations to return.
+
+        Returns:
+        -------
+            A list of Station objects, highest ranked first.
+
+        """
+        return self._top(self._overall, limit)
+
+    def top_by_country(self, country_code: str, *, limit: int = 50) -> list[Station]:
+        """Get the top ranked stations of a country.
+
+        Args:
+        ----
+            country_code: ISO 3166-1 alpha-2 code of the country.
+            limit: Maximum number of stations to return.
+
+        Returns:
+        -------
+            A list of Station objects, highest ranked first.
+
+        """
+        return self._top(self._countries.get(country_code.upper()), limit)
+
+    def top_by_tag(self, tag: str, *, limit: int = 50) -> list[Station]:
+        """Get the top ranked stations with a tag.
+
+        Args:
+        ----
+            tag: Name of the tag.
+            limit: Maximum number of stations to return.
+
+        Returns:
+        -------
+            A list of Station objects, highest ranked first.
+
+        """
+        return self._top(self._tags.get(tag.lower()), limit)
+
+    def top_by_language(self, language: str, *, limit: int = 50) -> list[Station]:
+        """Get the top ranked stations in a language.
+
+        Args:
+        ----
+            language: Name of the language.
+            limit: Maximum number of stations to return.
+
+        Returns:
+        -------
+            A list of Station objects, highest ranked first.
+
+        """
+        return self._top(self._languages.get(language.lower()), limit)
@@ -0,0 +1,134 @@
+"""Tests for the Radio Browser response cache backends."""
+
+import asyncio
+import sqlite3
+from pathlib import Path
+
+import aiohttp
+import pytest
+from aresponses import ResponsesMockServer
+
+from radios import MemoryCache, RadioBrowser, SQLiteCache
+from radios.cache import CacheBackend
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request: pytest.FixtureRequest, tmp_path: Path) -> CacheBackend:
+    """Return each of the cache backends."""
+    if request.param == "memory":
+        return MemoryCache()
+    return SQLiteCache(tmp_path / "cache.db", poll_interval=0.01)
+
+
+async def test_get_set(cache: CacheBackend) -> None:
+    """Test responses are stored until they expire."""
+    assert await cache.get("stats") is None
+    await cache.set("stats", '{"status": "ok"}', 60)
+    assert await cache.get("stats") == '{"status": "ok"}'
+    await cache.set("stats", '{"status": "ok"}', -1)
+    assert await cache.get("stats") is None
+
+
+async def test_lock(cache: CacheBackend) -> None:
+    """Test the lock is exclusive per key."""
+    events: list[str] = []
+
+    async def hold(name: str) -> None:
+        async with cache.lock("stats"):
+            events.append(f"{name} start")
+            await asyncio.sleep(0.05)
+            events.append(f"{name} end")
+
+    await asyncio.gather(hold("first"), hold("second"))
+    assert events[0].endswith("start")
+    assert events[1].endswith("end")
+    assert events[2].endswith("start")
+
+
+async def test_shared_between_instances(tmp_path: Path) -> None:
+    """Test SQLite caches on the same file share responses."""
+    await SQLiteCache(tmp_path / "cache.db").set("stats", "shared", 60)
+    assert await SQLiteCache(tmp_path / "cache.db").get("stats") == "shared"
+
+
+async def test_cached_request(aresponses: ResponsesMockServer) -> None:
+    """Test concurrent requests are fetched from the API only once."""
+    aresponses.add(
+        "example.com",
+        "/json/test",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text='{"status": "ok"}',
+        ),
+    )
+    async with aiohttp.ClientSession() as session:
+        radio = RadioBrowser(session=session, user_agent="Test", cache=MemoryCache())
+        radio._host = "example.com"
+        responses = await asyncio.gather(
+            radio._request("test", params={"hidebroken": True}),
+            radio._request("test", params={"hidebroken": True}),
+        )
+        assert responses == ['{"status": "ok"}', '{"status": "ok"}']
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_memory_lock_removed_when_unused() -> None:
+    """Test locks of the memory cache do not outlive their users."""
+    cache = MemoryCache()
+
+    async def hold() -> None:
+        async with cache.lock("stats"):
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(hold(), hold())
+    assert cache._locks == {}
+    assert cache._lock_users == {}
+
+
+async def test_sqlite_lock_refreshed_while_held(tmp_path: Path) -> None:
+    """Test a lock held longer than its timeout is not taken over."""
+    cache = SQLiteCache(tmp_path / "cache.db", lock_timeout=0.1, poll_interval=0.01)
+    events: list[str] = []
+
+    async def hold(name: str) -> None:
+        async with cache.lock("stats"):
+            events.append(f"{name} start")
+            await asyncio.sleep(0.3)
+            events.append(f"{name} end")
+
+    await asyncio.gather(hold("first"), hold("second"))
+    assert events == ["first start", "first end", "second start", "second end"]
+
+
+def test_sqlite_stale_lock_release(tmp_path: Path) -> None:
+    """Test releasing a lock taken over after it expired keeps the new owner."""
+    cache = SQLiteCache(tmp_path / "cache.db", lock_timeout=-1)
+    assert cache._acquire("stats", "first")
+    assert cache._acquire("stats", "second")
+
+    cache.lock_timeout = 30
+    assert cache._acquire("stats", "third")
+    cache._release("stats", "first")
+    assert not cache._acquire("stats", "fourth")
+
+
+async def test_sqlite_lock_refresh_error(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a failing lock refresh is logged and the lock is still released."""
+    cache = SQLiteCache(tmp_path / "cache.db", lock_timeout=0.03)
+
+    def refresh(*_: str) -> None:
+        msg = "database is locked"
+        raise sqlite3.OperationalError(msg)
+
+    monkeypatch.setattr(cache, "_refresh", refresh)
+    async with cache.lock("stats"):
+        await asyncio.sleep(0.1)
+
+    assert "Failed to refresh the lock of stats" in caplog.text
+    assert cache._acquire("stats", "next")
@@ -0,0 +1,75 @@
+"""Tests for the geo-spatial station index."""
+
+import orjson
+
+from radios import Station, StationIndex
+
+from . import load_fixture
+
+
+def _index() -> StationIndex:
+    """Build an index from the stations fixture."""
+    stations = orjson.loads(load_fixture("stations.json"))
+    return StationIndex(Station.from_dict(station) for station in stations)
+
+
+def test_stations_without_coordinates_are_skipped() -> None:
+    """Test stations without a location are left out of the index."""
+    assert len(_index()) == 5
+
+
+def test_nearest() -> None:
+    """Test nearest stations are returned closest first."""
+    nearby = _index().nearest(52.37, 4.89, limit=3)
+    assert [result.station.name for result in nearby] == [
+        "Amsterdam FM",
+        "Utrecht Radio",
+        "Brussels Jazz",
+    ]
+    assert nearby[0].distance < 2
+    assert 30 < nearby[1].distance < 40
+
+
+def test_nearest_with_filters() -> None:
+    """Test nearest stations can be filtered by codec and bitrate."""
+    index = _index()
+    nearby = index.nearest(52.37, 4.89, limit=2, codec="mp3", bitrate_min=150)
+    assert [result.station.name for result in nearby] == [
+        "Brussels Jazz",
+        "Paris Classique",
+    ]
+    assert index.nearest(52.37, 4.89, codec="OGG") == []
+    assert index.nearest(52.37, 4.89, limit=0) == []
+
+
+def test_nearest_across_antimeridian() -> None:
+    """Test distances wrap around the antimeridian."""
+    nearby = _index().nearest(-17.0, -179.5, limit=1)
+    assert nearby[0].station.name == "Fiji Waves"
+    assert nearby[0].distance < 300
+
+
+def test_within_radius() -> None:
+    """Test all stations within a radius are returned."""
+    index = _index()
+    nearby = index.within_radius(52.37, 4.89, 200)
+    assert [result.station.name for result in nearby] == [
+        "Amsterdam FM",
+        "Utrecht Radio",
+        "Brussels Jazz",
+    ]
+    nearby = index.within_radius(52.37, 4.89, 200, bitrate_max=100)
+    assert [result.station.name for result in nearby] == ["Utrecht Radio"]
+
+
+def test_within_bbox() -> None:
+    """Test all stations within a bounding box are returned."""
+    index = _index()
+    stations = index.within_bbox(50, 3, 53, 6)
+    assert [station.name for station in stations] == [
+        "Brussels Jazz",
+        "Utrecht Radio",
+        "Amsterdam FM",
+    ]
+    stations = index.within_bbox(-20, 170, -10, -170, codec="AAC")
+    assert [station.name for station in stations] == ["Fiji Waves"]
@@ -0,0 +1,85 @@
+"""Tests for the import cost of the Radio Browser client."""
+
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = [
+    "aiodns",
+    "aiohttp",
+    "awesomeversion",
+    "backoff",
+    "mashumaro",
+    "pycountry",
+]
+
+
+def _import_time(module: str) -> int:
+    """Return the cumulative import time of a module in a fresh interpreter.
+
+    Takes the best of a few runs, to reduce noise. Times are in microseconds.
+    """
+    times = []
+    for _ in range(3):
+        report = subprocess.run(  # noqa: S603
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stderr
+        for line in report.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            _, cumulative, name = line.split("|")
+            if name.strip() == module:
+                times.append(int(cumulative))
+    return min(times)
+
+
+def _loaded_modules(code: str) -> set[str]:
+    """Run Python code in a fresh interpreter and return the loaded modules."""
+    return set(
+        subprocess.run(  # noqa: S603
+            [
+                sys.executable,
+                "-c",
+                f"{code}; import sys; print(*sys.modules)",
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.split()
+    )
+
+
+@pytest.mark.parametrize(
+    ("statement", "expected"),
+    [
+        ("import radios", []),
+        ("from radios import StationIndex, StationRanking, SQLiteCache", []),
+        # The client needs aiohttp to define its session field, which in
+        # turn imports aiodns for its resolver
+        ("from radios import RadioBrowser", ["aiodns", "aiohttp"]),
+    ],
+)
+def test_heavy_modules_are_lazy(statement: str, expected: list[str]) -> None:
+    """Test importing the package does not load heavy dependencies."""
+    loaded = _loaded_modules(statement)
+    assert [module for module in HEAVY_MODULES if module in loaded] == expected
+
+
+def test_lazy_attributes() -> None:
+    """Test lazily imported classes are available as attributes."""
+    loaded = _loaded_modules("import radios; radios.Station")
+    assert "radios.models" in loaded
+    assert "mashumaro" in loaded
+
+
+def test_import_time() -> None:
+    """Test importing the package is cheaper than importing asyncio.
+
+    The client and its dependencies all import asyncio, so this fails as
+    soon as any of them is imported eagerly again.
+    """
+    assert _import_time("radios") < _import_time("asyncio")
@@ -1,7 +1,12 @@
 """Asynchronous Python client for the Radio Browser API."""
 
 # pylint: disable=protected-access
+import asyncio
+from collections import deque
+from typing import get_type_hints
+
 import aiohttp
+from aiohttp import web
 from aresponses import ResponsesMockServer
 
 from radios.radio_browser import RadioBrowser
@@ -24,3 +29,96 @@ async def test_json_request(aresponses: ResponsesMockServer) -> None:
         radio._host = "example.com"
         response = await radio._request("test")
         assert response == '{"status": "ok"}'
+
+
+async def test_hedged_request(aresponses: ResponsesMockServer) -> None:
+    """Test a slow mirror is raced by a second one."""
+
+    async def slow_response(_: web.Request) -> web.Response:
+        await asyncio.sleep(1)
+        return web.Response(status=200, text="too late")
+
+    aresponses.add("slow.example.com", "/json/test", "GET", slow_response)
+    aresponses.add(
+        "fast.example.com",
+        "/json/test",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text='{"status": "ok"}',
+        ),
+    )
+    async with aiohttp.ClientSession() as session:
+        radio = RadioBrowser(
+            session=session, user_agent="Test", hedge=True, hedge_delay=0.05
+        )
+        radio._host = "slow.example.com"
+        radio._hosts = ["slow.example.com", "fast.example.com"]
+        response = await radio._request("test")
+        assert response == '{"status": "ok"}'
+        assert radio._host == "fast.example.com"
+
+
+async def test_hedged_request_p95_budget(aresponses: ResponsesMockServer) -> None:
+    """Test the hedge budget follows the observed latency of the endpoint."""
+
+    async def slow_response(_: web.Request) -> web.Response:
+        await asyncio.sleep(1)
+        return web.Response(status=200, text="too late")
+
+    aresponses.add(
+        "slow.example.com", "/json/stations/byname/test", "GET", slow_response
+    )
+    aresponses.add(
+        "fast.example.com",
+        "/json/stations/byname/test",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text="[]",
+        ),
+    )
+    async with aiohttp.ClientSession() as session:
+        radio = RadioBrowser(session=session, user_agent="Test", hedge=True)
+        radio._host = "slow.example.com"
+        radio._hosts = ["slow.example.com", "fast.example.com"]
+        assert radio._hedge_budget("stations/byname/test") == 1.0
+
+        radio._latencies["stations/byname"] = deque([0.05] * 20, maxlen=100)
+        assert radio._hedge_budget("stations/byname/other") == 0.05
+        assert radio._hedge_budget("stats") == 1.0
+
+        response = await radio._request("stations/byname/test")
+        assert response == "[]"
+        assert radio._host == "fast.example.com"
+        # Both the winner and the cancelled primary are recorded
+        assert len(radio._latencies["stations/byname"]) == 22
+        assert max(radio._latencies["stations/byname"]) >= 0.05
+
+
+async def test_station_click_not_hedged(aresponses: ResponsesMockServer) -> None:
+    """Test requests with side effects are only sent to a single mirror."""
+
+    async def slow_response(_: web.Request) -> web.Response:
+        await asyncio.sleep(0.2)
+        return web.Response(
+            status=200, headers={"Content-Type": "application/json"}, text="{}"
+        )
+
+    aresponses.add("slow.example.com", "/json/url/test", "GET", slow_response)
+    async with aiohttp.ClientSession() as session:
+        radio = RadioBrowser(
+            session=session, user_agent="Test", hedge=True, hedge_delay=0.01
+        )
+        radio._host = "slow.example.com"
+        radio._hosts = ["slow.example.com", "fast.example.com"]
+        await radio.station_click(uuid="test")
+    aresponses.assert_plan_strictly_followed()
+
+
+def test_type_hints() -> None:
+    """Test the fields of the client can be introspected."""
+    hints = get_type_hints(RadioBrowser)
+    assert hints["session"] == aiohttp.ClientSession | None
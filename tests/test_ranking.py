@@ -0,0 +1,80 @@
+"""Tests for the local station ranking."""
+
+import dataclasses
+
+import orjson
+import pytest
+
+from radios import Order, Station, StationRanking
+
+from . import load_fixture
+
+
+def _stations() -> list[Station]:
+    """Load the stations fixture."""
+    stations = orjson.loads(load_fixture("stations.json"))
+    return [Station.from_dict(station) for station in stations]
+
+
+def test_leaderboards() -> None:
+    """Test top stations per country, tag and language."""
+    ranking = StationRanking(_stations())
+    assert len(ranking) == 6
+    assert [station.name for station in ranking.top(limit=2)] == [
+        "Paris Classique",
+        "Amsterdam FM",
+    ]
+    assert [station.name for station in ranking.top_by_country("nl")] == [
+        "Amsterdam FM",
+        "Utrecht Radio",
+    ]
+    assert [station.name for station in ranking.top_by_tag("Pop")] == [
+        "Amsterdam FM",
+        "Utrecht Radio",
+        "Fiji Waves",
+    ]
+    assert [station.name for station in ranking.top_by_language("french")] == [
+        "Paris Classique",
+        "Brussels Jazz",
+    ]
+    assert ranking.top_by_country("XX") == []
+
+
+def test_order() -> None:
+    """Test ranking by a different field."""
+    ranking = StationRanking(_stations(), order=Order.VOTES)
+    assert [station.name for station in ranking.top_by_language("dutch")] == [
+        "Brussels Jazz",
+        "Amsterdam FM",
+        "Utrecht Radio",
+    ]
+
+    with pytest.raises(ValueError, match="Cannot rank stations by name"):
+        StationRanking(order=Order.NAME)
+
+
+def test_incremental_updates() -> None:
+    """Test stations can be updated and removed."""
+    stations = _stations()
+    ranking = StationRanking(stations)
+
+    ranking.update(dataclasses.replace(stations[1], click_count=5000))
+    assert [station.name for station in ranking.top_by_country("NL")] == [
+        "Utrecht Radio",
+        "Amsterdam FM",
+    ]
+
+    ranking.remove(stations[0].uuid)
+    ranking.remove("unknown")
+    assert len(ranking) == 5
+    assert [station.name for station in ranking.top_by_tag("pop")] == [
+        "Utrecht Radio",
+        "Fiji Waves",
+    ]
+    assert [station.name for station in ranking.top_by_tag("dance")] == [
+        "Internet Only"
+    ]
+
+    ranking.remove(stations[3].uuid)
+    assert ranking.top_by_tag("classical") == []
+    assert "classical" not in ranking._tags